@@ -71,8 +71,12 @@ VIEWING GEOMETRY (Matches sky appearance):
 - Result: +Y (North) appears UP
 """
 
+import sys
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba
 from typing import Dict, Tuple
 
 # ============================================================================
@@ -96,6 +100,7 @@ class Config:
     TAIL_WIDTH = 4
     TAIL_ALPHA = 0.2
     TAIL_COLOR = "#888888"
+    TAIL_SEED = 3628  # RNG seed for a reproducible tail (None = random)
     # Direction: East (+X) and North (+Y), slightly toward Earth (-Z)
     TAIL_DIRECTION = np.array([1.0, 0.15, -0.1])
     
@@ -142,7 +147,7 @@ class GalaxyData:
     | [1]        | RA/Dec/Redshift data - All galaxy positions (RA, Dec,       |
     |            | redshift) for NGC 3628, M66, and M65 are sourced from NED.  |
     |            | Used in GalaxyData.RA, GalaxyData.DEC, GalaxyData.REDSHIFT  |
-    |            | dictionaries.                                               |
+    |            | arrays (indexed by GalaxyData.NAMES).                       |
     +------------+-------------------------------------------------------------+
     | [2]        | Tidal tail orientation - The direction vector               |
     |            | [1.0, 0.15, -0.1] in Config.TAIL_DIRECTION is based on      |
@@ -168,97 +173,108 @@ class GalaxyData:
     +------------+-------------------------------------------------------------+
     """
     
-    # Raw astronomical data
-    RA = {
-        "NGC 3628": 11 + 20/60 + 17/3600,  # 11.3381 hours
-        "M66":      11 + 20/60 + 15/3600,  # 11.3375 hours
-        "M65":      11 + 18/60 + 56/3600   # 11.3156 hours
-    }
+    # Raw astronomical data (one entry per galaxy, in NAMES order;
+    # NGC 3628 first as the reference galaxy)
+    NAMES = ("NGC 3628", "M66", "M65")
     
-    DEC = {
-        "NGC 3628": 13 + 35/60 + 23/3600,  # 13.5897 degrees
-        "M66":      12 + 59/60 + 30/3600,  # 12.9917 degrees
-        "M65":      13 + 5/60 + 32/3600    # 13.0922 degrees
-    }
+    RA = np.array([
+        11 + 20/60 + 17/3600,  # NGC 3628: 11.3381 hours
+        11 + 20/60 + 15/3600,  # M66:      11.3375 hours
+        11 + 18/60 + 56/3600   # M65:      11.3156 hours
+    ])
     
-    REDSHIFT = {
-        "NGC 3628": 843,  # km/s
-        "M66":      727,
-        "M65":      807
-    }
+    DEC = np.array([
+        13 + 35/60 + 23/3600,  # NGC 3628: 13.5897 degrees
+        12 + 59/60 + 30/3600,  # M66:      12.9917 degrees
+        13 + 5/60 + 32/3600    # M65:      13.0922 degrees
+    ])
+    
+    REDSHIFT = np.array([
+        843,  # NGC 3628 (km/s)
+        727,  # M66
+        807   # M65
+    ], dtype=float)
     
     DISTANCE = 10700  # kpc
     DEGREE_TO_KPC = 0.017453293*DISTANCE   # kpc per degree at this distance
     
+    # Derived constants
+    _RA_DEG = RA * 15  # RA in degrees
+    _DEG_COS = DEGREE_TO_KPC * np.cos(np.radians(DEC[0]))  # kpc per RA degree at NGC 3628's Dec
+    
+    # The position arrays below depend only on the class constants above,
+    # so each is computed once and cached. They are shared by every caller,
+    # hence read-only; the public getters wrap them in fresh dicts.
+    
     @classmethod
-    def get_positions_relative_to_ngc3628(cls) -> Dict[str, np.ndarray]:
-        """Calculate positions relative to NGC 3628."""
-        # Convert RA from hours to degrees
-        ra_deg = {name: hours * 15 for name, hours in cls.RA.items()}
+    @lru_cache(maxsize=None)
+    def _relative_array(cls) -> np.ndarray:
+        """Calculate (N, 3) positions relative to NGC 3628, in NAMES order."""
+        # Offsets are taken from NGC 3628, the first entry of each array
         
-        # Get reference values
-        ra_ngc = ra_deg["NGC 3628"]
-        dec_ngc = cls.DEC["NGC 3628"]
-        z_ngc = cls.REDSHIFT["NGC 3628"]
+        # RA offset: positive = East
+        ra_offset_kpc = (cls._RA_DEG - cls._RA_DEG[0]) * cls._DEG_COS
         
-        positions = {}
+        # Dec offset: positive = North
+        dec_offset_kpc = (cls.DEC - cls.DEC[0]) * cls.DEGREE_TO_KPC
         
-        for name in cls.RA.keys():
-            # RA offset: positive = East
-            ra_offset_deg = ra_deg[name] - ra_ngc
-            ra_offset_kpc = ra_offset_deg * cls.DEGREE_TO_KPC * np.cos(np.radians(dec_ngc))
-            
-            # Dec offset: positive = North
-            dec_offset_deg = cls.DEC[name] - dec_ngc
-            dec_offset_kpc = dec_offset_deg * cls.DEGREE_TO_KPC
-            
-            # Z offset: positive = away from Earth
-            z_offset = cls.REDSHIFT[name] - z_ngc
-            z_offset_kpc = z_offset * 0.1  # Scale factor
-            
-            positions[name] = np.array([ra_offset_kpc, dec_offset_kpc, z_offset_kpc])
+        # Z offset: positive = away from Earth
+        z_offset_kpc = (cls.REDSHIFT - cls.REDSHIFT[0]) * 0.1  # Scale factor
+        
+        positions = np.column_stack([ra_offset_kpc, dec_offset_kpc, z_offset_kpc])
+        positions.flags.writeable = False
+        
+        return positions
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _centered_array(cls) -> np.ndarray:
+        """Calculate (N, 3) positions relative to triplet center, in NAMES order."""
+        rel_to_ngc = cls._relative_array()
+        positions = rel_to_ngc - rel_to_ngc.mean(axis=0, keepdims=True)
+        positions.flags.writeable = False
         
         return positions
     
+    @classmethod
+    def get_positions_relative_to_ngc3628(cls) -> Dict[str, np.ndarray]:
+        """Calculate positions relative to NGC 3628."""
+        return dict(zip(cls.NAMES, cls._relative_array()))
+    
     @classmethod
     def get_center(cls) -> np.ndarray:
         """Calculate triplet center (centroid)."""
-        positions = list(cls.get_positions_relative_to_ngc3628().values())
-        return np.mean(positions, axis=0)
+        return cls._relative_array().mean(axis=0)
     
     @classmethod
     def get_positions(cls) -> Dict[str, np.ndarray]:
         """Get galaxy positions relative to triplet center."""
-        rel_to_ngc = cls.get_positions_relative_to_ngc3628()
-        center = cls.get_center()
-        
-        positions = {}
-        for name, pos in rel_to_ngc.items():
-            positions[name] = pos - center
-        
-        return positions
+        return dict(zip(cls.NAMES, cls._centered_array()))
     
     @classmethod
     def verify_conventions(cls):
         """Verify all conventions are consistent."""
         positions = cls.get_positions()
         
-        print("\n" + "="*80)
-        print("SIGN CONVENTION VERIFICATION")
-        print("="*80)
-        print("\nCOORDINATE SYSTEM (Astronomically correct):")
-        print("  +X = EAST")
-        print("  +Y = NORTH")
-        print("  +Z = AWAY from Earth")
+        # Collect the report and write it in one go
+        lines = []
+        
+        lines.append("\n" + "="*80)
+        lines.append("SIGN CONVENTION VERIFICATION")
+        lines.append("="*80)
+        lines.append("\nCOORDINATE SYSTEM (Astronomically correct):")
+        lines.append("  +X = EAST")
+        lines.append("  +Y = NORTH")
+        lines.append("  +Z = AWAY from Earth")
         
-        print("\nVIEWING GEOMETRY (azim=-90):")
-        print("  Observer at -Z looking toward +Z")
-        print("  View rotated so +X (EAST) appears on LEFT")
-        print("  +Y (NORTH) appears UP")
+        lines.append("\nVIEWING GEOMETRY (azim=-90):")
+        lines.append("  Observer at -Z looking toward +Z")
+        lines.append("  View rotated so +X (EAST) appears on LEFT")
+        lines.append("  +Y (NORTH) appears UP")
         
-        print("\n" + "-"*80)
-        print("GALAXY POSITIONS (relative to center):")
-        print("-"*80)
+        lines.append("\n" + "-"*80)
+        lines.append("GALAXY POSITIONS (relative to center):")
+        lines.append("-"*80)
         
         for name, pos in positions.items():
             # Astronomical directions
@@ -270,29 +286,31 @@ class GalaxyData:
             visual_x = "LEFT" if pos[0] > 0 else "RIGHT"  # +X appears left
             visual_y = "UP" if pos[1] > 0 else "DOWN"
             
-            print(f"\n{name}:")
-            print(f"  True:      X={pos[0]:6.1f} kpc ({ew}), Y={pos[1]:6.1f} kpc ({ns})")
-            print(f"  Appears:   {visual_y}, {visual_x}")
+            lines.append(f"\n{name}:")
+            lines.append(f"  True:      X={pos[0]:6.1f} kpc ({ew}), Y={pos[1]:6.1f} kpc ({ns})")
+            lines.append(f"  Appears:   {visual_y}, {visual_x}")
             
             # Verify consistency
             if name == "NGC 3628":
                 assert pos[1] > 0, "NGC 3628 should be North of center"
-                print(f"  ✓ NGC 3628 is NORTH (appears UP)")
+                lines.append(f"  ✓ NGC 3628 is NORTH (appears UP)")
             elif name == "M66":
                 assert pos[0] > 0, "M66 should be East of center"
                 assert pos[1] < 0, "M66 should be South of center"
-                print(f"  ✓ M66 is EAST and SOUTH (appears DOWN, LEFT)")
+                lines.append(f"  ✓ M66 is EAST and SOUTH (appears DOWN, LEFT)")
             elif name == "M65":
                 assert pos[0] < 0, "M65 should be West of center"
                 assert pos[1] < 0, "M65 should be South of center"
-                print(f"  ✓ M65 is WEST and SOUTH (appears DOWN, RIGHT)")
+                lines.append(f"  ✓ M65 is WEST and SOUTH (appears DOWN, RIGHT)")
         
         # Verify tidal tail direction
         tail_dir = cls.get_tail_direction()
-        print(f"\nTIDAL TAIL:")
-        print(f"  Direction: [{tail_dir[0]:.2f}, {tail_dir[1]:.2f}, {tail_dir[2]:.2f}]")
-        print(f"  This means: EAST ({'+' if tail_dir[0]>0 else '-'}X), NORTH ({'+' if tail_dir[1]>0 else '-'}Y)")
-        print(f"  Appears: UPPER-LEFT from NGC 3628 ✓")
+        lines.append(f"\nTIDAL TAIL:")
+        lines.append(f"  Direction: [{tail_dir[0]:.2f}, {tail_dir[1]:.2f}, {tail_dir[2]:.2f}]")
+        lines.append(f"  This means: EAST ({'+' if tail_dir[0]>0 else '-'}X), NORTH ({'+' if tail_dir[1]>0 else '-'}Y)")
+        lines.append(f"  Appears: UPPER-LEFT from NGC 3628 ✓")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return True
     
@@ -312,7 +330,18 @@ class TidalTail:
     def __init__(self, config: Config):
         self.config = config
         
-    def generate(self, galaxy_positions: Dict[str, np.ndarray]) -> np.ndarray:
+        # Direction: East (+X) and North (+Y)
+        self._dir_unit = config.TAIL_DIRECTION / np.linalg.norm(config.TAIL_DIRECTION)
+        self._direction = self._dir_unit * config.TAIL_LENGTH
+        
+        # Direction, length and seed are fixed here; later changes to those
+        # Config values do not affect this generator
+        self._seed = config.TAIL_SEED
+        
+        # Generated tails, keyed by the settings read at generate() time
+        self._cache = {}
+        
+    def generate(self, ngc_pos: np.ndarray) -> np.ndarray:
         """
         Generate tidal tail extending EAST and NORTH from NGC 3628.
         
@@ -321,35 +350,52 @@ class TidalTail:
         https://noirlab.edu/public/images/noao-ngc3628/ 
         https://apod.grag.org/2021/07/24/structure-known-as-a-tidal-tail-ngc3628/
         and others
+        
+        ngc_pos is the position of NGC 3628, where the tail starts.
+        Each new (TAIL_POINTS, TAIL_WIDTH, ngc_pos) combination is drawn from
+        a fresh generator seeded with TAIL_SEED (as set at construction), so
+        the same settings always give the same tail. The result is cached and
+        read-only.
         """
-        ngc_pos = galaxy_positions["NGC 3628"]
+        key = (self.config.TAIL_POINTS,
+               self.config.TAIL_WIDTH,
+               tuple(ngc_pos))
         
-        # Direction: East (+X) and North (+Y)
-        direction = self.config.TAIL_DIRECTION
-        direction = direction / np.linalg.norm(direction) * self.config.TAIL_LENGTH
+        if key not in self._cache:
+            tail = self._generate(ngc_pos)
+            tail.flags.writeable = False
+            self._cache[key] = tail
+        
+        return self._cache[key]
+    
+    def _generate(self, ngc_pos: np.ndarray) -> np.ndarray:
+        """Generate tidal tail points starting at ngc_pos."""
+        rng = np.random.default_rng(self._seed)
         
         # Generate points with density decreasing along tail
-        t = np.random.beta(0.6, 1.8, self.config.TAIL_POINTS)
+        t = rng.beta(0.6, 1.8, self.config.TAIL_POINTS)
         
-        # Base points
-        points = ngc_pos + np.outer(t, direction)
+        # Base points, written straight into the output array
+        out = np.empty((self.config.TAIL_POINTS, 3))
+        np.multiply(t[:, None], self._direction, out=out)
+        out += ngc_pos
         
         # Add perpendicular dispersion
-        noise = np.random.normal(0, self.config.TAIL_WIDTH, 
-                                size=(self.config.TAIL_POINTS, 3))
+        noise = rng.standard_normal((self.config.TAIL_POINTS, 3))
+        noise *= self.config.TAIL_WIDTH
         
         # Remove component along tail
-        dir_unit = direction / np.linalg.norm(direction)
-        noise -= np.outer(np.dot(noise, dir_unit), dir_unit)
+        proj = noise @ self._dir_unit
+        noise -= proj[:, None] * self._dir_unit
+        out += noise
         
         # Add gentle curvature
         t_centered = t - 0.5
-        curvature = np.zeros_like(points)
-        curvature[:, 0] = t_centered * 5   # X-axis curve
-        curvature[:, 1] = t_centered * 8   # Y-axis curve
-        curvature[:, 2] = np.abs(t_centered) * 5  # Z-axis flaring
+        out[:, 0] += t_centered * 5   # X-axis curve
+        out[:, 1] += t_centered * 8   # Y-axis curve
+        out[:, 2] += np.abs(t_centered) * 5  # Z-axis flaring
         
-        return points + noise + curvature
+        return out
 
 
 # ============================================================================
@@ -367,6 +413,7 @@ class LeoTripletPlotter:
         self.fig = None
         self.ax = None
         self.positions = self.galaxy_data.get_positions()
+        self._ngc_pos = self.positions["NGC 3628"]
         
     def setup_figure(self):
         """Create figure and 3D axes."""
@@ -375,21 +422,22 @@ class LeoTripletPlotter:
         
     def plot_galaxies(self):
         """Plot galaxy markers."""
+        xyz = np.stack(list(self.positions.values()))
+        colors = [self.config.COLORS[name] for name in self.positions]
+        
+        # Galaxy markers
+        self.ax.scatter(xyz[:, 0], xyz[:, 1], xyz[:, 2],
+                      c=colors,
+                      s=self.config.GALAXY_SIZE,
+                      edgecolors='white',
+                      linewidth=1.5,
+                      alpha=1.0,
+                      depthshade=False)  # One marker per galaxy was never shaded
+        
+        # Labels
         for name, pos in self.positions.items():
-            color = self.config.COLORS[name]
-            
-            # Galaxy marker
-            self.ax.scatter(*pos, 
-                          color=color,
-                          s=self.config.GALAXY_SIZE,
-                          edgecolors='white',
-                          linewidth=1.5,
-                          alpha=1.0,
-                          depthshade=True)
-            
-            # Label
             self.ax.text(*pos, f"  {name}", 
-                        color=color,
+                        color=self.config.COLORS[name],
                         fontsize=11,
                         weight='bold')
     
@@ -405,30 +453,35 @@ class LeoTripletPlotter:
                     color=self.config.COLORS['center'],
                     fontsize=10)
     
+    @staticmethod
+    def _join_segments(segments: np.ndarray) -> np.ndarray:
+        """Join (M, 2, 3) segments into one path, separated by NaN rows."""
+        gaps = np.full((len(segments), 1, 3), np.nan)
+        return np.concatenate([segments, gaps], axis=1).reshape(-1, 3)
+    
     def plot_triangle(self):
         """Draw triangle connecting galaxies."""
-        names = list(self.positions.keys())
-        coords = [self.positions[n] for n in names]
+        coords = list(self.positions.values())
         
         # Triangle edges
         edges = [(0, 1), (1, 2), (2, 0)]
-        
-        for i, j in edges:
-            p1, p2 = coords[i], coords[j]
-            
-            # Draw edge
-            self.ax.plot([p1[0], p2[0]],
-                        [p1[1], p2[1]],
-                        [p1[2], p2[2]],
-                        '--',
-                        color=self.config.COLORS['triangle'],
-                        linewidth=1.5,
-                        alpha=0.6)
-            
-            # Distance label
-            mid = (p1 + p2) / 2
-            dist = np.linalg.norm(p2 - p1)
-            
+        segments = np.array([[coords[i], coords[j]] for i, j in edges])
+        
+        # Draw all edges as a single line
+        path = self._join_segments(segments)
+        self.ax.plot(path[:, 0],
+                    path[:, 1],
+                    path[:, 2],
+                    '--',
+                    color=self.config.COLORS['triangle'],
+                    linewidth=1.5,
+                    alpha=0.6)
+        
+        # Distance labels
+        mids = segments.mean(axis=1)
+        dists = np.linalg.norm(segments[:, 1] - segments[:, 0], axis=1)
+        
+        for mid, dist in zip(mids, dists):
             self.ax.text(*mid, f"{dist:.0f} kpc",
                         color=self.config.COLORS['triangle'],
                         fontsize=9,
@@ -440,23 +493,31 @@ class LeoTripletPlotter:
     
     def plot_tidal_tail(self):
         """Generate and plot tidal tail."""
-        tail = self.tail_generator.generate(self.positions)
-        ngc_pos = self.positions["NGC 3628"]
+        tail = self.tail_generator.generate(self._ngc_pos)
         
         # Calculate distances for size variation
-        distances = np.linalg.norm(tail - ngc_pos, axis=1)
-        sizes = 1 + 3 * (distances / distances.max())
+        diff = tail - self._ngc_pos
+        distances = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        norm = distances * (1.0 / distances.max())
+        sizes = 1 + 3 * norm
         
         # Color intensity varies with distance
-        alphas = self.config.TAIL_ALPHA * (0.5 + 0.5 * distances / distances.max())
-        colors = np.full(np.shape(distances),self.config.TAIL_COLOR)   
+        alphas = self.config.TAIL_ALPHA * (0.5 + 0.5 * norm)
+        
+        # Single RGBA array: tail color with per-point alpha. The alpha is
+        # squared because the former color=/alpha= array call applied it
+        # twice when drawing; this keeps the tail at the same brightness.
+        colors = np.empty((len(distances), 4))
+        colors[:] = to_rgba(self.config.TAIL_COLOR)
+        colors[:, 3] = alphas ** 2
         
         self.ax.scatter(tail[:, 0],
                        tail[:, 1],
                        tail[:, 2],
-                       color=colors,
-                       alpha=alphas,
-                       s=sizes,depthshade=True)
+                       c=colors,
+                       s=sizes,
+                       depthshade=False,
+                       rasterized=True)  # Many points: rasterize, keep rest vector
         
     
     def plot_earth(self):
@@ -474,7 +535,7 @@ class LeoTripletPlotter:
                        zorder=1000)
         
         # Earth label
-        self.ax.text(*earth_pos + np.array([0, -20, 0]), 'EARTH',
+        self.ax.text(earth_pos[0], earth_pos[1] - 20, earth_pos[2], 'EARTH',
                     color=self.config.COLORS['earth'],
                     fontsize=12,
                     weight='bold',
@@ -483,17 +544,21 @@ class LeoTripletPlotter:
                     zorder=1000)
         
         # View direction indicator (lines from Earth to triplet)
-        for x_offset in [-30, 30]:
-            for y_offset in [-30, 30]:
-                start = earth_pos + np.array([x_offset, y_offset, 0])
-                self.ax.plot([start[0], 0],
-                            [start[1], 0],
-                            [start[2], 50],
-                            color=self.config.COLORS['earth'],
-                            alpha=0.15,
-                            linestyle=':',
-                            linewidth=1,
-                            zorder=500)
+        starts = earth_pos + np.array([[-30, -30, 0],
+                                       [-30, 30, 0],
+                                       [30, -30, 0],
+                                       [30, 30, 0]])
+        ends = np.array([[0, 0, 50]] * 4)
+        path = self._join_segments(np.stack([starts, ends], axis=1))
+        
+        self.ax.plot(path[:, 0],
+                    path[:, 1],
+                    path[:, 2],
+                    color=self.config.COLORS['earth'],
+                    alpha=0.15,
+                    linestyle=':',
+                    linewidth=1,
+                    zorder=500)
     
     def setup_axes(self):
         """Configure axes labels and view."""
@@ -540,15 +605,17 @@ class LeoTripletPlotter:
         def on_scroll(event):
             scale = 1/self.config.ZOOM_SCALE if event.button == 'up' else self.config.ZOOM_SCALE
             
-            for axis, getter, setter in [
-                ('x', self.ax.get_xlim3d, self.ax.set_xlim3d),
-                ('y', self.ax.get_ylim3d, self.ax.set_ylim3d),
-                ('z', self.ax.get_zlim3d, self.ax.set_zlim3d)
-            ]:
-                limits = getter()
-                mid = np.mean(limits)
-                half = (limits[1] - limits[0]) * scale / 2
-                setter([mid - half, mid + half])
+            # (3, 2) array of [min, max] for the x, y and z axes
+            limits = np.array([self.ax.get_xlim3d(),
+                               self.ax.get_ylim3d(),
+                               self.ax.get_zlim3d()])
+            mids = limits.mean(axis=1, keepdims=True)
+            halves = (limits[:, 1:2] - limits[:, 0:1]) * scale * 0.5
+            new_limits = np.hstack([mids - halves, mids + halves])
+            
+            self.ax.set_xlim3d(new_limits[0])
+            self.ax.set_ylim3d(new_limits[1])
+            self.ax.set_zlim3d(new_limits[2])
             
             self.fig.canvas.draw_idle()
         
@@ -580,54 +647,64 @@ class LeoTripletPlotter:
 # MAIN
 # ============================================================================
 
+# Console report printed by main()
+REFERENCES_TEXT = """
+================================================================================
+DATA REFERENCES
+================================================================================
+[1] NASA/IPAC Extragalactic Database (NED). (2024).
+    - NGC 3628: 11h20m17.0s, +13°35′23″, v=843±1 km/s
+    - M66 (NGC 3627): 11h20m15.0s, +12°59′30″, v=727±3 km/s
+    - M65 (NGC 3623): 11h18m56.0s, +13°05′32″, v=807±3 km/s
+    Retrieved from https://ned.ipac.caltech.edu/
+
+[2] NOIRLab/NSF. (2021). Galaxy NGC 3628 and its Tidal Tail.
+    Image noao-ngc3628. Retrieved from
+    https://noirlab.edu/public/images/noao-ngc3628/
+
+[3] European Southern Observatory. (2010). VST Snaps a Galactic Do-Si-Do.
+    Eso1043fr. Retrieved from https://www.eso.org/public/news/eso1043/
+
+[4] Garcia, A. M. (1993). General study of group membership. II.
+    Astronomy and Astrophysics Supplement Series, 100, 47-90.
+    (LGG 231 - Leo Triplet group identification)
+
+[5] Arp, H. (1966). Atlas of Peculiar Galaxies.
+    California Institute of Technology. (Arp 317)
+
+[6] Wikipedia contributors. (2024). NGC 3628. In Wikipedia.
+    Retrieved from https://en.wikipedia.org/wiki/NGC_3628
+"""
+
+SUMMARY_TEXT = """
+================================================================================
+VISUALIZATION COMPLETE
+================================================================================
+✓ +X = EAST (astronomically correct)
+✓ +Y = NORTH (astronomically correct)
+✓ View rotated with azim=-90
+✓ EAST appears on LEFT (matches sky)
+✓ X-axis shows POSITIVE values for EAST
+✓ Tidal tail: +X (EAST) and +Y (NORTH)
+✓ Tail appears UPPER-LEFT (matches NOIRLab image)
+✓ Earth marker shows observer position at -Z
+"""
+
+
 def main():
     """Main execution."""
     try:
         # Verify all conventions
         GalaxyData.verify_conventions()
         
-        print("\n" + "="*80)
-        print("DATA REFERENCES")
-        print("="*80)
-        print("[1] NASA/IPAC Extragalactic Database (NED). (2024).")
-        print("    - NGC 3628: 11h20m17.0s, +13°35′23″, v=843±1 km/s")
-        print("    - M66 (NGC 3627): 11h20m15.0s, +12°59′30″, v=727±3 km/s")
-        print("    - M65 (NGC 3623): 11h18m56.0s, +13°05′32″, v=807±3 km/s")
-        print("    Retrieved from https://ned.ipac.caltech.edu/")
-        print()
-        print("[2] NOIRLab/NSF. (2021). Galaxy NGC 3628 and its Tidal Tail.")
-        print("    Image noao-ngc3628. Retrieved from")
-        print("    https://noirlab.edu/public/images/noao-ngc3628/")
-        print()
-        print("[3] European Southern Observatory. (2010). VST Snaps a Galactic Do-Si-Do.")
-        print("    Eso1043fr. Retrieved from https://www.eso.org/public/news/eso1043/")
-        print()
-        print("[4] Garcia, A. M. (1993). General study of group membership. II.")
-        print("    Astronomy and Astrophysics Supplement Series, 100, 47-90.")
-        print("    (LGG 231 - Leo Triplet group identification)")
-        print()
-        print("[5] Arp, H. (1966). Atlas of Peculiar Galaxies.")
-        print("    California Institute of Technology. (Arp 317)")
-        print()
-        print("[6] Wikipedia contributors. (2024). NGC 3628. In Wikipedia.")
-        print("    Retrieved from https://en.wikipedia.org/wiki/NGC_3628")
+        sys.stdout.write(REFERENCES_TEXT)
         
         # Create and show plot
         plotter = LeoTripletPlotter()
         plotter.plot()
         plotter.show()
         
-        print("\n" + "="*80)
-        print("VISUALIZATION COMPLETE")
-        print("="*80)
-        print("✓ +X = EAST (astronomically correct)")
-        print("✓ +Y = NORTH (astronomically correct)")
-        print("✓ View rotated with azim=-90")
-        print("✓ EAST appears on LEFT (matches sky)")
-        print("✓ X-axis shows POSITIVE values for EAST")
-        print("✓ Tidal tail: +X (EAST) and +Y (NORTH)")
-        print("✓ Tail appears UPPER-LEFT (matches NOIRLab image)")
-        print("✓ Earth marker shows observer position at -Z")
+        sys.stdout.write(SUMMARY_TEXT)
         
     except Exception as e:
         print(f"Error: {e}")